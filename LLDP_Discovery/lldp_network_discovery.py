@@ -11,11 +11,50 @@ import json
 import yaml
 import re
 import argparse
+import atexit
 import logging
+import socket
+import threading
 from typing import Dict, List, Tuple, Optional
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 
+# orjson serializes in C and is much faster than stdlib json for large
+# topologies; fall back to stdlib when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Pre-compiled parsing patterns (compiled once at import, not per line)
+_MIKROTIK_NAME = re.compile(r'name:\s*(\S+)')
+_MK_RECORD_START = re.compile(r'^\s*\d')
+_MK_KV = re.compile(r'^\s*(?:\d+\s+)?([\w-]+)\s*=\s*(.*)$')
+_ARUBA_HOSTNAME = re.compile(r'^\s*hostname\s+"?([^"\s]+)"?', re.MULTILINE)
+_ARISTA_HOSTNAME = re.compile(r'^\s*Hostname:\s*(\S+)', re.MULTILINE)
+# Single multiline alternation per vendor: finditer walks the raw output
+# buffer once, yielding only matched fields (no per-line split/strip),
+# dispatched on match.lastgroup
+# EOS prefixes detail fields with a dash ('- System Name: ...'), so each
+# anchor tolerates an optional leading '-'. Whitespace inside a field is
+# [ \t] rather than \s so an empty field line (a TLV the neighbor didn't
+# advertise) can't swallow the following line.
+_ARUBA_ANY = re.compile(
+    r'^[ \t]*(?:-[ \t]*)?Local Port[ \t]*:[ \t]*(?P<local>\S+)'
+    r'|^[ \t]*(?:-[ \t]*)?System Name[ \t]*:[ \t]*(?P<sysname>.+)'
+    r'|^[ \t]*(?:-[ \t]*)?Port ID[ \t]*:[ \t]*(?P<portid>.+)'
+    r'|^[ \t]*(?:-[ \t]*)?Management Address[ \t]*:[ \t]*(?P<mgmt>\S+)',
+    re.MULTILINE
+)
+_ARISTA_ANY = re.compile(
+    r'^[ \t]*(?:-[ \t]*)?Interface[ \t]+(?P<local>\S+)[ \t]+detected'
+    r'|^[ \t]*(?:-[ \t]*)?System Name:[ \t]*"?(?P<sysname>[^"\n]+)"?'
+    r'|^[ \t]*(?:-[ \t]*)?Port ID[ \t]*:[ \t]*"?(?P<portid>[^"\n]+)"?'
+    r'|^[ \t]*(?:-[ \t]*)?Management Address[ \t]*:[ \t]*(?P<mgmt>\S+)',
+    re.MULTILINE
+)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -24,9 +63,66 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class Neighbor:
+    """One parsed LLDP neighbor (slot layout avoids a dict per record)
+
+    __slots__ is spelled out by hand rather than via dataclass(slots=True),
+    which needs Python 3.10; the scripts support 3.7+.
+    """
+
+    __slots__ = ('local_port', 'remote_device', 'remote_port', 'remote_ip')
+
+    def __init__(self, local_port: str = '', remote_device: str = '',
+                 remote_port: str = '', remote_ip: str = 'N/A'):
+        self.local_port = local_port
+        self.remote_device = remote_device
+        self.remote_port = remote_port
+        self.remote_ip = remote_ip
+
+    def __bool__(self) -> bool:
+        # Truthy once any field has been populated, mirroring the truthiness
+        # of the dicts these records replaced
+        return bool(self.local_port or self.remote_device
+                    or self.remote_port or self.remote_ip != 'N/A')
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Neighbor):
+            return NotImplemented
+        return (self.local_port == other.local_port
+                and self.remote_device == other.remote_device
+                and self.remote_port == other.remote_port
+                and self.remote_ip == other.remote_ip)
+
+    def __repr__(self) -> str:
+        return (f'Neighbor(local_port={self.local_port!r}, '
+                f'remote_device={self.remote_device!r}, '
+                f'remote_port={self.remote_port!r}, '
+                f'remote_ip={self.remote_ip!r})')
+
+
 class SwitchConnection:
     """Base class for switch connections"""
 
+    # Vendor CLI commands, set by each subclass
+    HOSTNAME_COMMAND = ''
+    LLDP_COMMAND = ''
+
+    # Shell-session helpers: how this vendor's CLI prints a sentinel marker,
+    # and how to turn off interactive paging first (empty = not needed)
+    SENTINEL_COMMAND = 'echo {}'
+    PAGING_OFF_COMMAND = ''
+
+    # Cache of live SSH clients keyed by (hostname, username, port) so that
+    # repeat runs against the same fleet skip the KEX/auth handshake
+    _client_cache: Dict[Tuple[str, str, int], paramiko.SSHClient] = {}
+    _cache_lock = threading.Lock()
+
+    # Skip the slow legacy KEX/key fallbacks during algorithm negotiation
+    _DISABLED_ALGORITHMS = {
+        'kex': ['diffie-hellman-group-exchange-sha1', 'diffie-hellman-group1-sha1'],
+        'keys': ['ssh-dss']
+    }
+
     def __init__(self, hostname: str, username: str, password: str, port: int = 22):
         self.hostname = hostname
         self.username = username
@@ -36,19 +132,35 @@ class SwitchConnection:
         self.shell = None
 
     def connect(self) -> bool:
-        """Establish SSH connection to the switch"""
+        """Establish SSH connection to the switch, reusing a cached client"""
+        cache_key = (self.hostname, self.username, self.port)
+
+        with self._cache_lock:
+            cached = self._client_cache.get(cache_key)
+            if cached is not None:
+                transport = cached.get_transport()
+                if transport is not None and transport.is_active():
+                    self.client = cached
+                    logger.info(f"Reusing connection to {self.hostname}")
+                    return True
+                del self._client_cache[cache_key]
+
         try:
-            self.client = paramiko.SSHClient()
-            self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            self.client.connect(
+            client = paramiko.SSHClient()
+            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            client.connect(
                 self.hostname,
                 port=self.port,
                 username=self.username,
                 password=self.password,
                 timeout=10,
                 look_for_keys=False,
-                allow_agent=False
+                allow_agent=False,
+                disabled_algorithms=self._DISABLED_ALGORITHMS
             )
+            with self._cache_lock:
+                self._client_cache[cache_key] = client
+            self.client = client
             logger.info(f"Connected to {self.hostname}")
             return True
         except Exception as e:
@@ -56,10 +168,18 @@ class SwitchConnection:
             return False
 
     def disconnect(self):
-        """Close SSH connection"""
+        """Release the connection (kept open in the cache for reuse)"""
         if self.client:
-            self.client.close()
-            logger.info(f"Disconnected from {self.hostname}")
+            self.client = None
+            logger.info(f"Released connection to {self.hostname}")
+
+    @classmethod
+    def close_all(cls):
+        """Close every cached SSH connection"""
+        with cls._cache_lock:
+            for client in cls._client_cache.values():
+                client.close()
+            cls._client_cache.clear()
 
     def execute_command(self, command: str, timeout: int = 30) -> str:
         """Execute command and return output"""
@@ -74,47 +194,149 @@ class SwitchConnection:
             logger.error(f"Failed to execute command on {self.hostname}: {str(e)}")
             return ""
 
+    def execute_many(self, commands: List[str], timeout: int = 30) -> List[str]:
+        """Execute several commands over one shell channel
+
+        exec_command opens a fresh SSH channel (an extra round-trip plus a
+        server-side shell start) per command. Sending all commands through a
+        single invoke_shell session, delimited by sentinels printed via the
+        vendor's SENTINEL_COMMAND, pays that cost once per host instead of
+        once per command. If the sentinels never arrive the method falls
+        back to one exec_command per command rather than guessing at chunk
+        boundaries.
+        """
+        try:
+            shell = self.client.invoke_shell()
+            shell.settimeout(timeout)
+
+            # invoke_shell allocates a PTY, so interactive paging
+            # ('-- MORE --' prompts) would stall the transcript; disable it
+            # first where the vendor needs that
+            send_commands = list(commands)
+            skip = 0
+            if self.PAGING_OFF_COMMAND:
+                send_commands.insert(0, self.PAGING_OFF_COMMAND)
+                skip = 1
+
+            for i, command in enumerate(send_commands):
+                shell.send(f'{command}\n')
+                shell.send(self.SENTINEL_COMMAND.format(f'__END_{i}__') + '\n')
+
+            # The sentinel printed by the shell sits on its own line; the
+            # echoed sentinel command line does not. Check the cheap
+            # substring first so the regex only runs when it could match
+            final_text = f'__END_{len(send_commands) - 1}__'
+            final = re.compile(rf'^\s*{final_text}\s*$', re.MULTILINE)
+            buffer = ''
+            complete = False
+            while True:
+                if final_text in buffer and final.search(buffer):
+                    complete = True
+                    break
+                try:
+                    chunk = shell.recv(65535).decode('utf-8', errors='replace')
+                except socket.timeout:
+                    break
+                if not chunk:
+                    break
+                buffer += chunk
+            shell.close()
+
+            if not complete:
+                logger.warning(f"Command sentinel never arrived on "
+                               f"{self.hostname}; falling back to one "
+                               f"channel per command")
+                return [self.execute_command(command, timeout=timeout)
+                        for command in commands]
+
+            outputs = []
+            current = []
+            for line in buffer.splitlines():
+                stripped = line.strip()
+                if stripped == f'__END_{len(outputs)}__':
+                    outputs.append('\n'.join(current))
+                    current = []
+                    if len(outputs) == len(send_commands):
+                        break
+                elif '__END_' in line:
+                    # Device echo of the sentinel command
+                    continue
+                elif (len(outputs) < len(send_commands)
+                        and stripped.endswith(send_commands[len(outputs)])):
+                    # Device echo of the sent command (possibly prompt-prefixed)
+                    continue
+                else:
+                    current.append(line)
+            while len(outputs) < len(send_commands):
+                outputs.append('\n'.join(current))
+                current = []
+            return outputs[skip:]
+        except Exception as e:
+            logger.error(f"Failed to execute commands on {self.hostname}: {str(e)}")
+            return ['' for _ in commands]
+
+    def get_device_data(self) -> Tuple[str, List[Neighbor]]:
+        """Fetch hostname and LLDP neighbors in a single shell session"""
+        hostname_out, lldp_out = self.execute_many(
+            [self.HOSTNAME_COMMAND, self.LLDP_COMMAND]
+        )
+        return self._parse_hostname(hostname_out), self._parse_neighbors(lldp_out)
+
+
+atexit.register(SwitchConnection.close_all)
+
 
 class MikrotikSwitch(SwitchConnection):
     """Mikrotik-specific switch handler"""
 
+    HOSTNAME_COMMAND = "/system identity print"
+    LLDP_COMMAND = "/ip neighbor print detail without-paging"
+    # RouterOS has no 'echo'; :put prints its argument
+    SENTINEL_COMMAND = ':put "{}"'
+
     def get_hostname(self) -> str:
         """Get switch hostname"""
-        output = self.execute_command("/system identity print")
-        match = re.search(r'name:\s*(\S+)', output)
+        return self._parse_hostname(self.execute_command(self.HOSTNAME_COMMAND))
+
+    def _parse_hostname(self, output: str) -> str:
+        match = _MIKROTIK_NAME.search(output)
         return match.group(1) if match else self.hostname
 
-    def get_lldp_neighbors(self) -> List[Dict]:
+    def get_lldp_neighbors(self) -> List[Neighbor]:
         """Get LLDP neighbor information"""
-        output = self.execute_command("/ip neighbor print detail")
+        return self._parse_neighbors(self.execute_command(self.LLDP_COMMAND))
+
+    def _parse_neighbors(self, output: str) -> List[Neighbor]:
         neighbors = []
 
         # Parse Mikrotik LLDP output
-        current_neighbor = {}
-        for line in output.split('\n'):
-            line = line.strip()
-            if not line or line.startswith('Flags:'):
+        current_neighbor = Neighbor()
+        for line in output.splitlines():
+            if not line.strip() or line.lstrip().startswith('Flags:'):
                 continue
 
-            if re.match(r'^\d+', line):
+            if _MK_RECORD_START.match(line):
                 if current_neighbor:
                     neighbors.append(current_neighbor)
-                current_neighbor = {}
+                current_neighbor = Neighbor()
 
-            # Parse key-value pairs
-            if '=' in line:
-                parts = line.split('=', 1)
-                key = parts[0].strip()
-                value = parts[1].strip() if len(parts) > 1 else ''
+            # Parse key-value pairs; the substring test is a fast negative
+            # filter that skips the regex on non-field lines
+            if '=' not in line:
+                continue
+            match = _MK_KV.match(line)
+            if match:
+                key = match.group(1)
+                value = match.group(2).rstrip()
 
                 if 'interface' in key.lower():
-                    current_neighbor['local_port'] = value
+                    current_neighbor.local_port = value
                 elif 'identity' in key.lower() or 'system-name' in key.lower():
-                    current_neighbor['remote_device'] = value
+                    current_neighbor.remote_device = value
                 elif 'interface-name' in key.lower():
-                    current_neighbor['remote_port'] = value
+                    current_neighbor.remote_port = value
                 elif 'address' in key.lower():
-                    current_neighbor['remote_ip'] = value
+                    current_neighbor.remote_ip = value
 
         if current_neighbor:
             neighbors.append(current_neighbor)
@@ -125,42 +347,39 @@ class MikrotikSwitch(SwitchConnection):
 class ArubaSwitch(SwitchConnection):
     """Aruba-specific switch handler"""
 
+    HOSTNAME_COMMAND = "show running-config | include hostname"
+    LLDP_COMMAND = "show lldp neighbors-information detail"
+    PAGING_OFF_COMMAND = "no page"
+
     def get_hostname(self) -> str:
         """Get switch hostname"""
-        output = self.execute_command("show running-config | include hostname")
-        match = re.search(r'hostname\s+"?([^"\s]+)"?', output)
+        return self._parse_hostname(self.execute_command(self.HOSTNAME_COMMAND))
+
+    def _parse_hostname(self, output: str) -> str:
+        match = _ARUBA_HOSTNAME.search(output)
         return match.group(1) if match else self.hostname
 
-    def get_lldp_neighbors(self) -> List[Dict]:
+    def get_lldp_neighbors(self) -> List[Neighbor]:
         """Get LLDP neighbor information"""
-        output = self.execute_command("show lldp neighbors-information detail")
-        neighbors = []
+        return self._parse_neighbors(self.execute_command(self.LLDP_COMMAND))
 
-        current_neighbor = {}
-        for line in output.split('\n'):
-            line = line.strip()
+    def _parse_neighbors(self, output: str) -> List[Neighbor]:
+        neighbors = []
 
-            # Local port
-            match = re.search(r'Local Port\s*:\s*(\S+)', line)
-            if match:
+        current_neighbor = Neighbor()
+        for match in _ARUBA_ANY.finditer(output):
+            kind = match.lastgroup
+            if kind == 'local':
+                # Local port starts a new neighbor record
                 if current_neighbor:
                     neighbors.append(current_neighbor)
-                current_neighbor = {'local_port': match.group(1)}
-
-            # Remote system name
-            match = re.search(r'System Name\s*:\s*(.+)', line)
-            if match:
-                current_neighbor['remote_device'] = match.group(1).strip()
-
-            # Remote port
-            match = re.search(r'Port ID\s*:\s*(.+)', line)
-            if match:
-                current_neighbor['remote_port'] = match.group(1).strip()
-
-            # Remote IP
-            match = re.search(r'Management Address\s*:\s*(\S+)', line)
-            if match:
-                current_neighbor['remote_ip'] = match.group(1)
+                current_neighbor = Neighbor(local_port=match.group('local'))
+            elif kind == 'sysname':
+                current_neighbor.remote_device = match.group('sysname').strip()
+            elif kind == 'portid':
+                current_neighbor.remote_port = match.group('portid').strip()
+            elif kind == 'mgmt':
+                current_neighbor.remote_ip = match.group('mgmt')
 
         if current_neighbor:
             neighbors.append(current_neighbor)
@@ -171,49 +390,39 @@ class ArubaSwitch(SwitchConnection):
 class AristaSwitch(SwitchConnection):
     """Arista-specific switch handler"""
 
+    HOSTNAME_COMMAND = "show hostname"
+    LLDP_COMMAND = "show lldp neighbors detail"
+    PAGING_OFF_COMMAND = "terminal length 0"
+
     def get_hostname(self) -> str:
         """Get switch hostname"""
-        output = self.execute_command("show hostname")
-        lines = output.strip().split('\n')
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith('Hostname:') and not line.startswith('FQDN:'):
-                return line
-            match = re.search(r'Hostname:\s*(\S+)', line)
-            if match:
-                return match.group(1)
-        return self.hostname
+        return self._parse_hostname(self.execute_command(self.HOSTNAME_COMMAND))
+
+    def _parse_hostname(self, output: str) -> str:
+        match = _ARISTA_HOSTNAME.search(output)
+        return match.group(1) if match else self.hostname
 
-    def get_lldp_neighbors(self) -> List[Dict]:
+    def get_lldp_neighbors(self) -> List[Neighbor]:
         """Get LLDP neighbor information"""
-        output = self.execute_command("show lldp neighbors detail")
-        neighbors = []
+        return self._parse_neighbors(self.execute_command(self.LLDP_COMMAND))
 
-        current_neighbor = {}
-        for line in output.split('\n'):
-            line = line.strip()
+    def _parse_neighbors(self, output: str) -> List[Neighbor]:
+        neighbors = []
 
-            # Interface line
-            match = re.search(r'Interface\s+(\S+)\s+detected', line)
-            if match:
+        current_neighbor = Neighbor()
+        for match in _ARISTA_ANY.finditer(output):
+            kind = match.lastgroup
+            if kind == 'local':
+                # Interface line starts a new neighbor record
                 if current_neighbor:
                     neighbors.append(current_neighbor)
-                current_neighbor = {'local_port': match.group(1)}
-
-            # Remote system name
-            match = re.search(r'System Name:\s*"?([^"\n]+)"?', line)
-            if match:
-                current_neighbor['remote_device'] = match.group(1).strip()
-
-            # Remote port
-            match = re.search(r'Port ID\s*:\s*"?([^"\n]+)"?', line)
-            if match:
-                current_neighbor['remote_port'] = match.group(1).strip()
-
-            # Remote IP
-            match = re.search(r'Management Address\s*:\s*(\S+)', line)
-            if match:
-                current_neighbor['remote_ip'] = match.group(1)
+                current_neighbor = Neighbor(local_port=match.group('local'))
+            elif kind == 'sysname':
+                current_neighbor.remote_device = match.group('sysname').strip()
+            elif kind == 'portid':
+                current_neighbor.remote_port = match.group('portid').strip()
+            elif kind == 'mgmt':
+                current_neighbor.remote_ip = match.group('mgmt')
 
         if current_neighbor:
             neighbors.append(current_neighbor)
@@ -245,67 +454,107 @@ class NetworkDiscovery:
             logger.error(f"Failed to load config: {str(e)}")
             raise
 
-    def discover_network(self):
-        """Discover the entire network topology"""
-        switches = self.config.get('switches', [])
+    def _discover_one(self, switch_config: Dict) -> Optional[Tuple[str, Dict, List[Dict]]]:
+        """Discover a single switch; returns (device_name, device_info, connections)"""
+        hostname = switch_config['hostname']
+        vendor = switch_config['vendor'].lower()
+        username = switch_config.get('username', self.config.get('default_username'))
+        password = switch_config.get('password', self.config.get('default_password'))
 
-        for switch_config in switches:
-            hostname = switch_config['hostname']
-            vendor = switch_config['vendor'].lower()
-            username = switch_config.get('username', self.config.get('default_username'))
-            password = switch_config.get('password', self.config.get('default_password'))
+        logger.info(f"Discovering {hostname} ({vendor})")
 
-            logger.info(f"Discovering {hostname} ({vendor})")
+        if vendor not in self.switch_classes:
+            logger.warning(f"Unsupported vendor: {vendor}")
+            return None
 
-            if vendor not in self.switch_classes:
-                logger.warning(f"Unsupported vendor: {vendor}")
-                continue
+        switch_class = self.switch_classes[vendor]
+        switch = switch_class(hostname, username, password)
 
-            switch_class = self.switch_classes[vendor]
-            switch = switch_class(hostname, username, password)
+        if not switch.connect():
+            return None
 
-            if not switch.connect():
-                continue
+        try:
+            device_name, neighbors = switch.get_device_data()
+
+            device_info = {
+                'hostname': hostname,
+                'vendor': vendor,
+                'ip': hostname
+            }
+
+            connections = []
+            for neighbor in neighbors:
+                if neighbor.local_port and neighbor.remote_device and neighbor.remote_port:
+                    connections.append({
+                        'local_device': device_name,
+                        'local_port': neighbor.local_port,
+                        'remote_device': neighbor.remote_device,
+                        'remote_port': neighbor.remote_port,
+                        'remote_ip': neighbor.remote_ip
+                    })
+                    logger.info(f"  {device_name}:{neighbor.local_port} -> "
+                              f"{neighbor.remote_device}:{neighbor.remote_port}")
+
+            return device_name, device_info, connections
+
+        finally:
+            switch.disconnect()
+
+    def discover_network(self, max_workers: Optional[int] = None):
+        """Discover the entire network topology
+
+        Switches are queried concurrently: each discovery spends almost all
+        of its time blocked on SSH round-trips, so a thread pool collapses
+        the wall-clock to roughly the slowest switch instead of the sum.
+        """
+        switches = self.config.get('switches', [])
 
-            try:
-                device_name = switch.get_hostname()
-                neighbors = switch.get_lldp_neighbors()
-
-                self.devices[device_name] = {
-                    'hostname': hostname,
-                    'vendor': vendor,
-                    'ip': hostname
-                }
-
-                for neighbor in neighbors:
-                    if all(k in neighbor for k in ['local_port', 'remote_device', 'remote_port']):
-                        connection = {
-                            'local_device': device_name,
-                            'local_port': neighbor['local_port'],
-                            'remote_device': neighbor['remote_device'],
-                            'remote_port': neighbor['remote_port'],
-                            'remote_ip': neighbor.get('remote_ip', 'N/A')
-                        }
-                        self.topology[device_name].append(connection)
-                        logger.info(f"  {device_name}:{neighbor['local_port']} -> "
-                                  f"{neighbor['remote_device']}:{neighbor['remote_port']}")
-
-            finally:
-                switch.disconnect()
+        # Re-arm the defaultdict so the method can be re-run after a previous
+        # call froze the topology into a plain dict
+        self.topology = defaultdict(list, self.topology)
+
+        if switches:
+            if max_workers is None:
+                max_workers = min(32, len(switches))
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self._discover_one, switch_config)
+                           for switch_config in switches]
+
+                # Merge results from the main thread only; workers share no state
+                for future in as_completed(futures):
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"Discovery worker failed: {str(e)}")
+                        continue
+                    if result is None:
+                        continue
+                    device_name, device_info, connections = result
+                    self.devices[device_name] = device_info
+                    self.topology[device_name].extend(connections)
+
+        # Freeze into a plain dict so downstream readers get the mapping
+        # as-is, with no defaultdict factory and no per-call copies
+        self.topology = dict(self.topology)
 
     def export_to_json(self, filename: str):
         """Export topology to JSON file"""
         output = {
             'devices': self.devices,
-            'connections': dict(self.topology)
+            'connections': self.topology
         }
-        with open(filename, 'w') as f:
-            json.dump(output, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(output, f, indent=2)
         logger.info(f"Topology exported to {filename}")
 
     def get_topology_data(self) -> Tuple[Dict, Dict]:
         """Return topology data for visualization"""
-        return self.devices, dict(self.topology)
+        return self.devices, self.topology
 
 
 def main():
@@ -313,6 +562,8 @@ def main():
     parser.add_argument('-c', '--config', required=True, help='Configuration file (YAML)')
     parser.add_argument('-o', '--output', default='network_topology.json',
                        help='Output JSON file')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                       help='Number of concurrent switch connections')
     parser.add_argument('-v', '--verbose', action='store_true',
                        help='Verbose logging')
 
@@ -322,7 +573,7 @@ def main():
         logger.setLevel(logging.DEBUG)
 
     discovery = NetworkDiscovery(args.config)
-    discovery.discover_network()
+    discovery.discover_network(max_workers=args.workers)
     discovery.export_to_json(args.output)
 
     logger.info("Discovery complete!")
@@ -9,16 +9,99 @@ Copyright (c) 2025 Darren Soothill
 import json
 import argparse
 import logging
-from typing import Dict, List
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# orjson parses in C; fall back to stdlib json when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import networkx as nx
+import matplotlib
+matplotlib.use('Agg')  # headless rendering; skip GUI backend probing
 import matplotlib.pyplot as plt
 from matplotlib.patches import FancyBboxPatch
 import matplotlib.patches as mpatches
 
+# Numba is optional: when available, spring layout runs as a compiled
+# parallel kernel instead of networkx's pure-Python loop
+try:
+    import numba
+    import numpy as np
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+if HAS_NUMBA:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _fr_layout_kernel(indices, indptr, n, iters, k, seed):
+        """Fruchterman-Reingold forces over a CSR adjacency, float32 positions"""
+        np.random.seed(seed)
+        pos = (np.random.random((n, 2)).astype(np.float32) - 0.5) * 2.0
+        t = np.float32(0.1)
+        dt = t / np.float32(iters + 1)
+
+        for _ in range(iters):
+            disp = np.zeros((n, 2), dtype=np.float32)
+            for i in numba.prange(n):
+                # Repulsion from every other node
+                for j in range(n):
+                    if i == j:
+                        continue
+                    dx = pos[i, 0] - pos[j, 0]
+                    dy = pos[i, 1] - pos[j, 1]
+                    d2 = dx * dx + dy * dy + np.float32(1e-9)
+                    f = k * k / d2
+                    disp[i, 0] += dx * f
+                    disp[i, 1] += dy * f
+                # Attraction along incident edges
+                for e in range(indptr[i], indptr[i + 1]):
+                    j = indices[e]
+                    dx = pos[i, 0] - pos[j, 0]
+                    dy = pos[i, 1] - pos[j, 1]
+                    d = np.sqrt(dx * dx + dy * dy) + np.float32(1e-9)
+                    f = d / k
+                    disp[i, 0] -= dx * f
+                    disp[i, 1] -= dy * f
+
+            # Move each node, capped by the cooling temperature
+            for i in numba.prange(n):
+                dx = disp[i, 0]
+                dy = disp[i, 1]
+                d = np.sqrt(dx * dx + dy * dy) + np.float32(1e-9)
+                step = min(d, t)
+                pos[i, 0] += dx / d * step
+                pos[i, 1] += dy / d * step
+            t -= dt
+
+        return pos
+
+
+def _spring_layout(graph, k=2, iterations=50, seed=42):
+    """Spring layout via the Numba kernel, falling back to networkx"""
+    if HAS_NUMBA and graph.number_of_nodes() > 1:
+        try:
+            adj = nx.to_scipy_sparse_array(graph, format='csr')
+            coords = _fr_layout_kernel(
+                adj.indices.astype(np.int64),
+                adj.indptr.astype(np.int64),
+                graph.number_of_nodes(),
+                iterations,
+                np.float32(k),
+                seed
+            )
+            return {node: coords[i] for i, node in enumerate(graph)}
+        except Exception as e:
+            logger.warning(f"Numba layout failed, using networkx: {str(e)}")
+    return nx.spring_layout(graph, k=k, iterations=iterations, seed=seed)
+
+
 class NetworkVisualizer:
     """Creates visual network topology graphs"""
 
@@ -26,7 +109,11 @@ class NetworkVisualizer:
         self.topology_file = topology_file
         self.devices = {}
         self.connections = {}
+        self._conn_index: Dict[Tuple[str, str], Dict] = {}
         self.graph = nx.Graph()
+        # Per-instance memo so repeated renders of the same topology reuse
+        # already-built edge labels
+        self._edge_label = lru_cache(maxsize=None)(self._edge_label_uncached)
         self.vendor_colors = {
             'mikrotik': '#E91E63',  # Pink
             'aruba': '#FF9800',     # Orange
@@ -37,25 +124,58 @@ class NetworkVisualizer:
     def load_topology(self):
         """Load topology from JSON file"""
         try:
-            with open(self.topology_file, 'r') as f:
-                data = json.load(f)
+            with open(self.topology_file, 'rb') as f:
+                if orjson is not None:
+                    data = orjson.loads(f.read())
+                else:
+                    data = json.load(f)
                 self.devices = data.get('devices', {})
                 self.connections = data.get('connections', {})
+            # Index connections by (local, remote) so edge lookups are O(1)
+            # instead of a linear scan per edge
+            self._conn_index = {
+                (local_device, conn['remote_device']): conn
+                for local_device, conns in self.connections.items()
+                for conn in conns
+            }
+            self._edge_label.cache_clear()
             logger.info(f"Loaded topology from {self.topology_file}")
         except Exception as e:
             logger.error(f"Failed to load topology: {str(e)}")
             raise
 
+    def _edge_label_uncached(self, u: str, v: str) -> Optional[str]:
+        """Build the port label for edge (u, v); direction comes from the index"""
+        data = self.graph.edges[u, v]
+        local_port = data.get('local_port', '')
+        remote_port = data.get('remote_port', '')
+
+        if (u, v) in self._conn_index:
+            return f"{local_port}\n↕\n{remote_port}"
+        if (v, u) in self._conn_index:
+            return f"{remote_port}\n↕\n{local_port}"
+        return None
+
     def build_graph(self):
         """Build NetworkX graph from topology data"""
-        # Add all devices as nodes
+        # GraphViz defaults, honored by the pydot DOT export
+        self.graph.graph['graph'] = {'layout': 'neato', 'overlap': 'false',
+                                     'splines': 'true'}
+        self.graph.graph['node'] = {'shape': 'box', 'style': 'filled',
+                                    'fontname': 'Arial'}
+
+        # Add all devices as nodes, annotated once for both the image and
+        # DOT outputs
         for device_name, device_info in self.devices.items():
             vendor = device_info.get('vendor', 'unknown')
+            ip = device_info.get('ip', '')
             self.graph.add_node(
                 device_name,
                 vendor=vendor,
                 hostname=device_info.get('hostname', ''),
-                ip=device_info.get('ip', '')
+                ip=ip,
+                label=f"{device_name}\\n{vendor.upper()}\\n{ip}",
+                fillcolor=self.vendor_colors.get(vendor, self.vendor_colors['unknown'])
             )
 
         # Add connections as edges
@@ -66,23 +186,28 @@ class NetworkVisualizer:
                 local_port = conn['local_port']
                 remote_port = conn['remote_port']
 
-                # Avoid duplicate edges
-                edge_key = tuple(sorted([local_device, remote_device]))
+                # Avoid duplicate edges (ordered pair, no list/sort per edge)
+                edge_key = ((local_device, remote_device)
+                            if local_device < remote_device
+                            else (remote_device, local_device))
                 if edge_key not in added_edges:
                     self.graph.add_edge(
                         local_device,
                         remote_device,
                         local_port=local_port,
-                        remote_port=remote_port
+                        remote_port=remote_port,
+                        label=f"{local_port} - {remote_port}",
+                        fontsize=8
                     )
                     added_edges.add(edge_key)
 
         logger.info(f"Graph built: {self.graph.number_of_nodes()} nodes, "
                    f"{self.graph.number_of_edges()} edges")
 
-    def visualize_network(self, output_file: str = 'network_topology.png',
+    def visualize_network(self, output_file: str = 'network_topology.svg',
                          layout: str = 'spring', show_labels: bool = True,
-                         show_ports: bool = True):
+                         show_ports: bool = True, fmt: Optional[str] = None,
+                         dpi: int = 100):
         """Create and save network visualization"""
 
         if self.graph.number_of_nodes() == 0:
@@ -96,7 +221,7 @@ class NetworkVisualizer:
 
         # Choose layout algorithm
         if layout == 'spring':
-            pos = nx.spring_layout(self.graph, k=2, iterations=50, seed=42)
+            pos = _spring_layout(self.graph, k=2, iterations=50, seed=42)
         elif layout == 'circular':
             pos = nx.circular_layout(self.graph)
         elif layout == 'kamada_kawai':
@@ -119,21 +244,10 @@ class NetworkVisualizer:
         # Draw edge labels (port information)
         if show_ports:
             edge_labels = {}
-            for u, v, data in self.graph.edges(data=True):
-                local_port = data.get('local_port', '')
-                remote_port = data.get('remote_port', '')
-
-                # Determine which device is which
-                if u in self.connections:
-                    for conn in self.connections[u]:
-                        if conn['remote_device'] == v:
-                            edge_labels[(u, v)] = f"{local_port}\n↕\n{remote_port}"
-                            break
-                elif v in self.connections:
-                    for conn in self.connections[v]:
-                        if conn['remote_device'] == u:
-                            edge_labels[(u, v)] = f"{remote_port}\n↕\n{local_port}"
-                            break
+            for u, v in self.graph.edges():
+                label = self._edge_label(u, v)
+                if label is not None:
+                    edge_labels[(u, v)] = label
 
             nx.draw_networkx_edge_labels(
                 self.graph, pos,
@@ -144,10 +258,12 @@ class NetworkVisualizer:
                 ax=ax
             )
 
-        # Draw nodes with vendor-specific colors
-        for vendor_type in set(nx.get_node_attributes(self.graph, 'vendor').values()):
-            nodes_of_type = [n for n, d in self.graph.nodes(data=True)
-                           if d.get('vendor') == vendor_type]
+        # Draw nodes with vendor-specific colors, grouped in one pass
+        vendor_to_nodes = defaultdict(list)
+        for node, data in self.graph.nodes(data=True):
+            vendor_to_nodes[data.get('vendor', 'unknown')].append(node)
+
+        for vendor_type, nodes_of_type in vendor_to_nodes.items():
             color = self.vendor_colors.get(vendor_type, self.vendor_colors['unknown'])
 
             nx.draw_networkx_nodes(
@@ -199,77 +315,103 @@ class NetworkVisualizer:
         ax.axis('off')
         plt.tight_layout()
 
-        # Save figure
-        plt.savefig(output_file, dpi=300, bbox_inches='tight',
+        # Save figure; fmt=None lets matplotlib infer the format from the
+        # filename (SVG is vector, so dpi only matters for raster formats)
+        plt.savefig(output_file, dpi=dpi, format=fmt, bbox_inches='tight',
                    facecolor='white', edgecolor='none')
         logger.info(f"Visualization saved to {output_file}")
 
         return fig
 
+    def _iter_report_lines(self) -> Iterator[str]:
+        """Yield the text report line by line (including newlines)"""
+        yield "=" * 80 + "\n"
+        yield "NETWORK TOPOLOGY REPORT\n"
+        yield "=" * 80 + "\n\n"
+
+        yield f"Total Devices: {len(self.devices)}\n"
+        yield f"Total Connections: {sum(len(c) for c in self.connections.values())}\n\n"
+
+        yield "DEVICES\n"
+        yield "-" * 80 + "\n"
+        for device_name, device_info in sorted(self.devices.items()):
+            yield f"\nDevice: {device_name}\n"
+            yield f"  Vendor: {device_info.get('vendor', 'N/A').upper()}\n"
+            yield f"  IP/Hostname: {device_info.get('hostname', 'N/A')}\n"
+
+            if device_name in self.connections:
+                yield f"  Connections: {len(self.connections[device_name])}\n"
+
+        yield "\n\nCONNECTIONS\n"
+        yield "-" * 80 + "\n"
+        for local_device, connections in sorted(self.connections.items()):
+            yield f"\n{local_device}:\n"
+            for conn in sorted(connections, key=lambda x: x['local_port']):
+                yield (f"  {conn['local_port']:15} <--> "
+                       f"{conn['remote_device']:20} ({conn['remote_port']})\n")
+
+        yield "\n" + "=" * 80 + "\n"
+
     def generate_text_report(self, output_file: str = 'network_topology.txt'):
         """Generate a text-based topology report"""
-        with open(output_file, 'w') as f:
-            f.write("=" * 80 + "\n")
-            f.write("NETWORK TOPOLOGY REPORT\n")
-            f.write("=" * 80 + "\n\n")
-
-            f.write(f"Total Devices: {len(self.devices)}\n")
-            f.write(f"Total Connections: {sum(len(c) for c in self.connections.values())}\n\n")
-
-            f.write("DEVICES\n")
-            f.write("-" * 80 + "\n")
-            for device_name, device_info in sorted(self.devices.items()):
-                f.write(f"\nDevice: {device_name}\n")
-                f.write(f"  Vendor: {device_info.get('vendor', 'N/A').upper()}\n")
-                f.write(f"  IP/Hostname: {device_info.get('hostname', 'N/A')}\n")
-
-                if device_name in self.connections:
-                    f.write(f"  Connections: {len(self.connections[device_name])}\n")
-
-            f.write("\n\nCONNECTIONS\n")
-            f.write("-" * 80 + "\n")
-            for local_device, connections in sorted(self.connections.items()):
-                f.write(f"\n{local_device}:\n")
-                for conn in sorted(connections, key=lambda x: x['local_port']):
-                    f.write(f"  {conn['local_port']:15} <--> "
-                           f"{conn['remote_device']:20} ({conn['remote_port']})\n")
-
-            f.write("\n" + "=" * 80 + "\n")
+        # writelines hits the buffer once per line batch instead of paying a
+        # locked write call per f.write
+        with open(output_file, 'w', buffering=1 << 20) as f:
+            f.writelines(self._iter_report_lines())
 
         logger.info(f"Text report saved to {output_file}")
 
+    def _iter_dot_lines(self) -> Iterator[str]:
+        """Yield the GraphViz DOT file line by line (including newlines)"""
+        yield "graph NetworkTopology {\n"
+        yield "    layout=neato;\n"
+        yield "    overlap=false;\n"
+        yield "    splines=true;\n"
+        yield "    node [shape=box, style=filled, fontname=Arial];\n\n"
+
+        # Nodes
+        for device_name, device_info in self.devices.items():
+            vendor = device_info.get('vendor', 'unknown')
+            color = self.vendor_colors.get(vendor, self.vendor_colors['unknown'])
+            label = f"{device_name}\\n{vendor.upper()}\\n{device_info.get('ip', '')}"
+            yield f'    "{device_name}" [label="{label}", fillcolor="{color}"];\n'
+
+        yield "\n"
+
+        # Edges
+        added_edges = set()
+        for local_device, connections in self.connections.items():
+            for conn in connections:
+                remote_device = conn['remote_device']
+                edge_key = ((local_device, remote_device)
+                            if local_device < remote_device
+                            else (remote_device, local_device))
+
+                if edge_key not in added_edges:
+                    label = f"{conn['local_port']} - {conn['remote_port']}"
+                    yield (f'    "{local_device}" -- "{remote_device}" '
+                           f'[label="{label}", fontsize=8];\n')
+                    added_edges.add(edge_key)
+
+        yield "}\n"
+
     def generate_graphviz_dot(self, output_file: str = 'network_topology.dot'):
         """Generate GraphViz DOT file for advanced visualization"""
-        with open(output_file, 'w') as f:
-            f.write("graph NetworkTopology {\n")
-            f.write("    layout=neato;\n")
-            f.write("    overlap=false;\n")
-            f.write("    splines=true;\n")
-            f.write("    node [shape=box, style=filled, fontname=Arial];\n\n")
-
-            # Write nodes
-            for device_name, device_info in self.devices.items():
-                vendor = device_info.get('vendor', 'unknown')
-                color = self.vendor_colors.get(vendor, self.vendor_colors['unknown'])
-                label = f"{device_name}\\n{vendor.upper()}\\n{device_info.get('ip', '')}"
-                f.write(f'    "{device_name}" [label="{label}", fillcolor="{color}"];\n')
-
-            f.write("\n")
-
-            # Write edges
-            added_edges = set()
-            for local_device, connections in self.connections.items():
-                for conn in connections:
-                    remote_device = conn['remote_device']
-                    edge_key = tuple(sorted([local_device, remote_device]))
-
-                    if edge_key not in added_edges:
-                        label = f"{conn['local_port']} - {conn['remote_port']}"
-                        f.write(f'    "{local_device}" -- "{remote_device}" '
-                               f'[label="{label}", fontsize=8];\n')
-                        added_edges.add(edge_key)
-
-            f.write("}\n")
+        # Prefer the pydot serializer, which reuses the graph annotated in
+        # build_graph instead of re-deduplicating edges in Python
+        if self.graph.number_of_nodes() > 0:
+            try:
+                from networkx.drawing.nx_pydot import write_dot
+                write_dot(self.graph, output_file)
+                logger.info(f"GraphViz DOT file saved to {output_file}")
+                return
+            except ImportError:
+                pass
+            except Exception as e:
+                logger.warning(f"pydot export failed, using built-in writer: {str(e)}")
+
+        with open(output_file, 'w', buffering=1 << 20) as f:
+            f.writelines(self._iter_dot_lines())
 
         logger.info(f"GraphViz DOT file saved to {output_file}")
 
@@ -280,8 +422,14 @@ def main():
     )
     parser.add_argument('-i', '--input', required=True,
                        help='Input topology JSON file')
-    parser.add_argument('-o', '--output', default='network_topology.png',
-                       help='Output image file')
+    parser.add_argument('-o', '--output', default=None,
+                       help='Output image file (default: network_topology.<format>)')
+    parser.add_argument('-f', '--format', default=None,
+                       choices=['svg', 'png', 'pdf'],
+                       help='Output format (default: inferred from the output '
+                            'filename, svg otherwise; svg renders fastest)')
+    parser.add_argument('--dpi', type=int, default=None,
+                       help='Raster DPI (default: 300 for png, 100 otherwise)')
     parser.add_argument('-l', '--layout', default='spring',
                        choices=['spring', 'circular', 'kamada_kawai', 'shell'],
                        help='Graph layout algorithm')
@@ -294,24 +442,39 @@ def main():
 
     args = parser.parse_args()
 
+    # An explicit output name keeps its extension's format (fmt=None lets
+    # matplotlib infer it); the svg default only applies when the output
+    # name is defaulted too
+    fmt = args.format
+    if args.output:
+        output_file = args.output
+    else:
+        fmt = fmt or 'svg'
+        output_file = f'network_topology.{fmt}'
+
+    is_png = fmt == 'png' or (fmt is None and output_file.lower().endswith('.png'))
+    dpi = args.dpi or (300 if is_png else 100)
+
     visualizer = NetworkVisualizer(args.input)
     visualizer.load_topology()
     visualizer.build_graph()
 
     # Generate visualization
     visualizer.visualize_network(
-        output_file=args.output,
+        output_file=output_file,
         layout=args.layout,
-        show_ports=not args.no_ports
+        show_ports=not args.no_ports,
+        fmt=fmt,
+        dpi=dpi
     )
 
     # Generate optional reports
     if args.text_report:
-        base_name = args.output.rsplit('.', 1)[0]
+        base_name = output_file.rsplit('.', 1)[0]
         visualizer.generate_text_report(f"{base_name}.txt")
 
     if args.dot_file:
-        base_name = args.output.rsplit('.', 1)[0]
+        base_name = output_file.rsplit('.', 1)[0]
         visualizer.generate_graphviz_dot(f"{base_name}.dot")
 
     logger.info("Visualization complete!")
@@ -11,7 +11,7 @@ set -e
 # Configuration
 CONFIG_FILE="${1:-switches_config.yaml}"
 OUTPUT_JSON="${2:-network_topology.json}"
-OUTPUT_IMAGE="${3:-network_topology.png}"
+OUTPUT_IMAGE="${3:-network_topology.svg}"
 LAYOUT="${4:-spring}"
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
@@ -87,8 +87,8 @@ echo ""
 echo "Generated files:"
 echo "  - Topology data: $OUTPUT_JSON"
 echo "  - Network map:   $OUTPUT_IMAGE"
-echo "  - Text report:   ${OUTPUT_IMAGE%.png}.txt"
-echo "  - DOT file:      ${OUTPUT_IMAGE%.png}.dot"
+echo "  - Text report:   ${OUTPUT_IMAGE%.*}.txt"
+echo "  - DOT file:      ${OUTPUT_IMAGE%.*}.dot"
 echo ""
 echo "View the network map:"
 echo "  open $OUTPUT_IMAGE"